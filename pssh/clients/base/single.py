@@ -34,7 +34,7 @@ from ssh2.exceptions import AgentConnectionError, AgentListIdentitiesError, \
     AgentAuthenticationError, AgentGetIdentityError
 
 from ..common import _validate_pkey_path
-from ...constants import DEFAULT_RETRIES, RETRY_DELAY
+from ...constants import DEFAULT_RETRIES, RETRY_DELAY, READ_CHUNK_SIZE
 from ..reader import ConcurrentRWBuffer
 from ...exceptions import UnknownHostError, AuthenticationError, \
     ConnectionError, Timeout
@@ -444,6 +444,41 @@ class BaseSSHClient(object):
         finally:
             timer.close()
 
+    def read_output_raw(self, output_buffer, chunk_size=READ_CHUNK_SIZE, timeout=None):
+        """Read raw bytes from output buffer.
+        Returns a generator of chunks of at most ``chunk_size`` bytes.
+
+        No line splitting or decoding is performed and output is not logged
+        to ``host_logger``.
+
+        :param output_buffer: Buffer to read from.
+        :type output_buffer: :py:class:`pssh.clients.reader.ConcurrentRWBuffer`
+        :param chunk_size: Maximum size of chunks in bytes.
+        :type chunk_size: int
+        :param timeout: Timeout in seconds for reading from buffer.
+        :type timeout: float
+        :rtype: generator
+
+        :raises: :py:class:`ValueError` if ``chunk_size`` is less than one.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least one byte - got %s" % (chunk_size,))
+        return self._read_output_raw(output_buffer, chunk_size, timeout=timeout)
+
+    def _read_output_raw(self, output_buffer, chunk_size, timeout=None):
+        timer = GTimeout(seconds=timeout, exception=Timeout)
+        timer.start()
+        try:
+            for data in output_buffer:
+                size = len(data)
+                if size <= chunk_size:
+                    yield data
+                    continue
+                for pos in range(0, size, chunk_size):
+                    yield data[pos:pos+chunk_size]
+        finally:
+            timer.close()
+
     def _read_output_to_buffer(self, read_func, _buffer):
         raise NotImplementedError
 
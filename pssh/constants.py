@@ -26,3 +26,7 @@ connections et al."""
 
 RETRY_DELAY = 5
 """Default delay in seconds between retry attempts for SSH client initialisation."""
+
+
+READ_CHUNK_SIZE = 65536
+"""Default maximum size in bytes of chunks returned by raw output reads."""
@@ -18,9 +18,11 @@
 
 """Output module of ParallelSSH"""
 
-from os import linesep
-
 from . import logger
+from .constants import READ_CHUNK_SIZE
+
+
+_LINESEP = '\n'
 
 
 class HostOutputBuffers(object):
@@ -115,17 +117,39 @@ class HostOutput(object):
         except Exception as ex:
             logger.error("Error getting exit status - %s", ex)
 
+    def read_stdout_chunks(self, chunk_size=READ_CHUNK_SIZE):
+        """Read raw standard output bytes in chunks of at most ``chunk_size``.
+
+        Output is not split into lines, decoded or logged. Shares position
+        with ``stdout`` - use one or the other to read output.
+
+        :param chunk_size: Maximum size of chunks in bytes.
+        :type chunk_size: int
+        :rtype: generator
+        """
+        if not self.client:
+            return
+        return self.client.read_output_raw(
+            self.buffers.stdout.rw_buffer, chunk_size=chunk_size, timeout=self.read_timeout)
+
+    def read_stderr_chunks(self, chunk_size=READ_CHUNK_SIZE):
+        """Read raw standard error bytes in chunks of at most ``chunk_size``.
+
+        See :py:func:`read_stdout_chunks`.
+
+        :rtype: generator
+        """
+        if not self.client:
+            return
+        return self.client.read_output_raw(
+            self.buffers.stderr.rw_buffer, chunk_size=chunk_size, timeout=self.read_timeout)
+
     def __repr__(self):
-        return "\thost={host}{linesep}" \
-            "\texit_code={exit_code}{linesep}" \
-            "\tchannel={channel}{linesep}" \
-            "\texception={exception}{linesep}" \
-            "\tencoding={encoding}{linesep}" \
-            "\tread_timeout={read_timeout}".format(
-                host=self.host, channel=self.channel,
-                exception=self.exception, linesep=linesep,
-                exit_code=self.exit_code, encoding=self.encoding, read_timeout=self.read_timeout,
-            )
-
-    def __str__(self):
-        return self.__repr__()
+        return f"\thost={self.host}{_LINESEP}" \
+            f"\texit_code={self.exit_code}{_LINESEP}" \
+            f"\tchannel={self.channel}{_LINESEP}" \
+            f"\texception={self.exception}{_LINESEP}" \
+            f"\tencoding={self.encoding}{_LINESEP}" \
+            f"\tread_timeout={self.read_timeout}"
+
+    __str__ = __repr__
@@ -97,6 +97,9 @@ class OpenSSHServer(object):
         sleep(.5)
         del sock
 
+    def is_alive(self):
+        return self.server_proc is not None and self.server_proc.poll() is None
+
     def stop(self):
         if self.server_proc is not None and self.server_proc.returncode is None:
             try:
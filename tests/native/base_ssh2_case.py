@@ -63,6 +63,10 @@ class SSH2TestCase(unittest.TestCase):
                                retry_delay=.1,
                                )
 
+    def setUp(self):
+        # Server is shared by all tests in class
+        self.assertTrue(self.server.is_alive(), msg="Test SSH server is not running")
+
     @classmethod
     def tearDownClass(cls):
         del cls.client
@@ -22,7 +22,7 @@ import tempfile
 from hashlib import sha256
 from datetime import datetime
 
-from gevent import sleep, spawn, Timeout as GTimeout
+from gevent import sleep, spawn, joinall, Timeout as GTimeout
 
 from pssh.clients.native import SSHClient
 from ssh2.session import Session
@@ -134,11 +134,11 @@ class SSH2ClientTest(SSH2TestCase):
     def test_stderr(self):
         host_out = self.client.run_command('echo "me" >&2')
         self.client.wait_finished(host_out)
-        output = list(host_out.stdout)
+        count = sum(1 for _ in host_out.stdout)
         stderr = list(host_out.stderr)
         expected = ['me']
         self.assertListEqual(expected, stderr)
-        self.assertTrue(len(output) == 0)
+        self.assertEqual(count, 0)
 
     def test_stdin(self):
         host_out = self.client.run_command('read line; echo $line')
@@ -148,12 +148,17 @@ class SSH2ClientTest(SSH2TestCase):
         stdout = list(host_out.stdout)
         self.assertListEqual(stdout, ['a line'])
 
+    def test_nonzero_exit_code(self):
+        host_out = self.client.run_command('exit 2')
+        self.client.wait_finished(host_out)
+        self.assertEqual(host_out.exit_code, 2)
+
     def test_long_running_cmd(self):
-        host_out = self.client.run_command('sleep .2; exit 2')
+        host_out = self.client.run_command('sleep .2')
         self.assertRaises(ValueError, self.client.wait_finished, host_out.channel)
+        self.assertFalse(self.client.finished(host_out.channel))
         self.client.wait_finished(host_out)
-        exit_code = host_out.exit_code
-        self.assertEqual(exit_code, 2)
+        self.assertTrue(self.client.finished(host_out.channel))
 
     def test_manual_auth(self):
         client = SSHClient(self.host, port=self.port,
@@ -274,10 +279,10 @@ class SSH2ClientTest(SSH2TestCase):
     def test_stdout_parsing(self):
         dir_list = os.listdir(os.path.expanduser('~'))
         host_out = self.client.run_command('ls -la')
-        output = list(host_out.stdout)
+        count = sum(1 for _ in host_out.stdout)
         # Output of `ls` will have 'total', '.', and '..' in addition to dir
         # listing
-        self.assertEqual(len(dir_list), len(output) - 3)
+        self.assertEqual(len(dir_list), count - 3)
 
     def test_file_output_parsing(self):
         lines = int(subprocess.check_output(
@@ -286,8 +291,18 @@ class SSH2ClientTest(SSH2TestCase):
         _file = os.sep.join((dir_name, '..', '..', 'README.rst'))
         cmd = 'cat %s' % _file
         host_out = self.client.run_command(cmd)
-        output = list(host_out.stdout)
-        self.assertEqual(lines, len(output))
+        count = sum(1 for _ in host_out.stdout)
+        self.assertEqual(lines, count)
+
+    def test_read_stdout_chunks(self):
+        dir_name = os.path.dirname(__file__)
+        _file = os.sep.join((dir_name, '..', '..', 'README.rst'))
+        with open(_file, 'rb') as fh:
+            contents = fh.read()
+        host_out = self.client.run_command('cat %s' % (_file,))
+        chunks = list(host_out.read_stdout_chunks(chunk_size=1024))
+        self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), contents)
 
     def test_identity_auth_failure(self):
         self.assertRaises(AuthenticationException,
@@ -343,16 +358,26 @@ class SSH2ClientTest(SSH2TestCase):
         # each other. session.disconnect can leave state in libssh2
         # and break subsequent sessions even on different socket and
         # session
+        def make_client():
+            return SSHClient(self.host, port=self.port,
+                             pkey=self.user_key,
+                             num_retries=1,
+                             allow_agent=False)
+
+        def run_and_disconnect(client):
+            host_out = client.run_command(self.cmd)
+            output = list(host_out.stdout)
+            self.assertListEqual(output, [self.resp])
+            client.disconnect()
+
         def scope_killer():
-            for _ in range(5):
-                client = SSHClient(self.host, port=self.port,
-                                   pkey=self.user_key,
-                                   num_retries=1,
-                                   allow_agent=False)
-                host_out = client.run_command(self.cmd)
-                output = list(host_out.stdout)
-                self.assertListEqual(output, [self.resp])
-                client.disconnect()
+            run_and_disconnect(make_client())
+            # New clients connect after first client has disconnected and gone
+            # out of scope - connect them concurrently.
+            client_greenlets = [spawn(make_client) for _ in range(4)]
+            joinall(client_greenlets, raise_error=True)
+            for client_greenlet in client_greenlets:
+                run_and_disconnect(client_greenlet.get())
         scope_killer()
 
     def test_agent_auth_exceptions(self):
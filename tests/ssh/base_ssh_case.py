@@ -80,6 +80,10 @@ class SSHTestCase(unittest.TestCase):
                                retry_delay=.1,
                                )
 
+    def setUp(self):
+        # Server is shared by all tests in class
+        self.assertTrue(self.server.is_alive(), msg="Test SSH server is not running")
+
     @classmethod
     def tearDownClass(cls):
         del cls.client
@@ -119,12 +119,17 @@ class SSHClientTest(SSHTestCase):
                             allow_agent=False)
         self.assertIsInstance(client, SSHClient)
 
+    def test_nonzero_exit_code(self):
+        host_out = self.client.run_command('exit 2')
+        self.client.wait_finished(host_out)
+        self.assertEqual(host_out.exit_code, 2)
+
     def test_long_running_cmd(self):
-        host_out = self.client.run_command('sleep .2; exit 2')
+        host_out = self.client.run_command('sleep .2')
         self.assertRaises(ValueError, self.client.wait_finished, host_out.channel)
+        self.assertFalse(self.client.finished(host_out.channel))
         self.client.wait_finished(host_out)
-        exit_code = host_out.exit_code
-        self.assertEqual(exit_code, 2)
+        self.assertTrue(self.client.finished(host_out.channel))
 
     def test_wait_finished_timeout(self):
         host_out = self.client.run_command('sleep .2')
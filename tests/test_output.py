@@ -21,7 +21,10 @@
 
 import unittest
 
+from gevent import sleep
 from pssh.output import HostOutput, BufferData, HostOutputBuffers
+from pssh.clients.reader import ConcurrentRWBuffer
+from pssh.clients.base.single import BaseSSHClient
 
 
 class TestHostOutput(unittest.TestCase):
@@ -60,3 +63,116 @@ class TestHostOutput(unittest.TestCase):
         self.assertEqual(exit_code, None)
         self.assertIsNone(host_out.stdout)
         self.assertIsNone(host_out.stderr)
+
+    def test_exit_code_not_cached(self):
+        # Exit status may be read as 0 after EOF but before server sends exit-status
+        class EarlyEOFClient(object):
+            exit_codes = [0, 2]
+            def get_exit_status(self, channel):
+                return self.exit_codes.pop(0)
+        host_out = HostOutput('host', None, None, client=EarlyEOFClient())
+        self.assertEqual(host_out.exit_code, 0)
+        self.assertEqual(host_out.exit_code, 2)
+
+    def test_partial_read_timeout_not_raised(self):
+        class ReadClient(object):
+            host = 'host'
+            read_output = BaseSSHClient.read_output
+            _read_output_buffer = BaseSSHClient._read_output_buffer
+            read_output_buffer = BaseSSHClient.read_output_buffer
+        rw_buffer = ConcurrentRWBuffer()
+        rw_buffer.write(b"line1\nline2\n")
+        host_out = HostOutput(
+            'host', None, None, client=ReadClient(), read_timeout=.2,
+            buffers=HostOutputBuffers(
+                BufferData(None, rw_buffer),
+                BufferData(None, None),
+            ))
+        for line in host_out.stdout:
+            self.assertEqual(line, 'line1')
+            break
+        # Read timeout of abandoned generator must not fire
+        sleep(.4)
+
+    def test_buffers_no_dict(self):
+        buffers = HostOutputBuffers(BufferData(None, None), BufferData(None, None))
+        self.assertFalse(hasattr(buffers, '__dict__'))
+        self.assertFalse(hasattr(buffers.stdout, '__dict__'))
+
+    def test_repr_does_not_read_output(self):
+        class NoReadClient(object):
+            def get_exit_status(self, channel):
+                return 0
+            def read_output(self, *args, **kwargs):
+                raise AssertionError("Output read from repr")
+            read_stderr = read_output_buffer = read_output
+        host_out = HostOutput(
+            'host', None, None, client=NoReadClient(),
+            buffers=HostOutputBuffers(
+                BufferData(None, None),
+                BufferData(None, None),
+            ))
+        self.assertTrue(repr(host_out))
+        self.assertTrue(str(host_out))
+
+    def test_read_chunks(self):
+        class RawClient(object):
+            read_output_raw = BaseSSHClient.read_output_raw
+            _read_output_raw = BaseSSHClient._read_output_raw
+        stdout_buffer = ConcurrentRWBuffer()
+        stdout_buffer.write(b"a line\nanother line\n")
+        stdout_buffer.eof.set()
+        stderr_buffer = ConcurrentRWBuffer()
+        stderr_buffer.write(b"err")
+        stderr_buffer.eof.set()
+        host_out = HostOutput(
+            'host', None, None, client=RawClient(),
+            buffers=HostOutputBuffers(
+                BufferData(None, stdout_buffer),
+                BufferData(None, stderr_buffer),
+            ))
+        chunks = list(host_out.read_stdout_chunks(chunk_size=8))
+        self.assertListEqual(chunks, [b"a line\na", b"nother l", b"ine\n"])
+        self.assertListEqual(list(host_out.read_stderr_chunks()), [b"err"])
+        self.assertIsNone(HostOutput('host', None, None, None).read_stdout_chunks())
+
+    def test_no_dict(self):
+        self.assertFalse(hasattr(self.output, '__dict__'))
+        self.assertRaises(AttributeError, setattr, self.output, 'not_a_slot', None)
+        for name in HostOutput.__slots__:
+            getattr(self.output, name)
+
+    def test_property_attribute_error_not_masked(self):
+        # HostOutput must not define __getattr__ - it would replace AttributeError
+        # raised inside output properties with one naming only the property.
+        class NoReadClient(object):
+            pass
+        host_out = HostOutput(
+            'host', None, None, client=NoReadClient(),
+            buffers=HostOutputBuffers(
+                BufferData(None, None),
+                BufferData(None, None),
+            ))
+        try:
+            host_out.stdout
+        except AttributeError as ex:
+            self.assertIn('read_output', str(ex))
+        else:
+            raise AssertionError("AttributeError not raised")
+
+    def test_read_chunks_invalid_size(self):
+        class RawClient(object):
+            read_output_raw = BaseSSHClient.read_output_raw
+        rw_buffer = ConcurrentRWBuffer()
+        rw_buffer.write(b"data")
+        host_out = HostOutput(
+            'host', None, None, client=RawClient(),
+            buffers=HostOutputBuffers(
+                BufferData(None, rw_buffer),
+                BufferData(None, rw_buffer),
+            ))
+        for chunk_size in (0, -1):
+            self.assertRaises(ValueError, host_out.read_stdout_chunks, chunk_size=chunk_size)
+            self.assertRaises(ValueError, host_out.read_stderr_chunks, chunk_size=chunk_size)
+        # Buffer not read from
+        self.assertEqual(rw_buffer.read(), b"data")